@@ -18,6 +18,7 @@ pkgs.python313Packages.buildPythonApplication {
 
   propagatedBuildInputs = with pkgs.python313Packages; [
     pygobject3
+    numpy
   ];
 
   desktopItems = [
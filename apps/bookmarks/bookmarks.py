@@ -217,19 +217,8 @@ class BookmarksWindow(PickerWindowWithPreview):
         thread.start()
 
     def on_search_changed(self, query):
-        self.remove_all_items()
-        if not query:
-            for bookmark in self._all_bookmarks:
-                self.add_item(bookmark)
-        else:
-            query_lower = query.lower()
-            for bookmark in self._all_bookmarks:
-                if (
-                    query_lower in bookmark.title.lower()
-                    or query_lower in bookmark.url.lower()
-                ):
-                    self.add_item(bookmark)
-        if self._item_store.get_n_items() > 0:
+        self.set_item_filter(query)
+        if self._filter_model.get_n_items() > 0:
             self._show_results()
             # Automatically select the first item to show its preview
             self._selection_model.set_selected(0)
@@ -241,6 +230,9 @@ class BookmarksWindow(PickerWindowWithPreview):
                 description="Try a different search term.",
             )
 
+    def get_search_key(self, item):
+        return f"{item.title}\n{item.url}"
+
     def on_item_activated(self, item):
         if item and item.url:
             Gtk.show_uri(self, item.url, Gdk.CURRENT_TIME)
@@ -375,9 +367,9 @@ class BookmarksWindow(PickerWindowWithPreview):
         if not self.get_visible() or not self.get_application():
             return GLib.SOURCE_REMOVE
         self._all_bookmarks = bookmarks
-        for bookmark in bookmarks:
-            self.add_item(bookmark)
-        if self._item_store.get_n_items() > 0:
+        self.invalidate_search_cache()
+        self.add_items(bookmarks)
+        if self._filter_model.get_n_items() > 0:
             self._show_results()
             # Automatically select the first item to show its preview
             self._selection_model.set_selected(0)
@@ -6,6 +6,27 @@ from gi.repository import Gtk, GLib, GObject
 from picker_window import PickerWindow, PickerItem
 from typing import Callable, List, Optional
 
+LIST_ITEM_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<interface>
+  <template class="GtkListItem">
+    <property name="child">
+      <object class="GtkLabel">
+        <property name="halign">start</property>
+        <property name="margin-top">8</property>
+        <property name="margin-bottom">8</property>
+        <property name="margin-start">12</property>
+        <property name="margin-end">12</property>
+        <binding name="label">
+          <lookup name="label" type="ContextMenuAction">
+            <lookup name="item">GtkListItem</lookup>
+          </lookup>
+        </binding>
+      </object>
+    </property>
+  </template>
+</interface>
+"""
+
 
 class ContextMenuAction(PickerItem):
     __gtype_name__ = "ContextMenuAction"
@@ -19,18 +40,6 @@ class ContextMenuAction(PickerItem):
         self.callback = callback
 
 
-
-class ContextMenuListItem(Gtk.Box):
-    def __init__(self):
-        super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
-        self.label = Gtk.Label()
-        self.label.set_halign(Gtk.Align.START)
-        self.label.set_margin_top(8)
-        self.label.set_margin_bottom(8)
-        self.label.set_margin_start(12)
-        self.label.set_margin_end(12)
-        self.append(self.label)
-
 class ContextMenuWindow(PickerWindow):
 
     def __init__(
@@ -57,19 +66,13 @@ class ContextMenuWindow(PickerWindow):
         pass
 
     def on_search_changed(self, query: str):
-        self._item_store.remove_all()
-        query_lower = query.lower()
-        for action in self._actions:
-            if (
-                not query
-                or query_lower in action.label.lower()
-                or query_lower in action.action_name.lower()
-            ):
-                if action.label.strip():
-                    self._item_store.append(action)
-        if self._item_store.get_n_items() > 0:
+        self.set_item_filter(query.lower())
+        if self._filter_model.get_n_items() > 0:
             self._selection_model.set_selected(0)
 
+    def get_search_key(self, item):
+        return f"{item.label}\0{item.action_name}"
+
     def on_item_activated(self, item):
         if (
             isinstance(item, ContextMenuAction)
@@ -82,19 +85,11 @@ class ContextMenuWindow(PickerWindow):
     def get_context_menu_model(self, item):
         return None
 
-    def setup_list_item(self, list_item):
-        widget = ContextMenuListItem()
-        list_item.set_child(widget)
-
-    def bind_list_item(self, list_item, item):
-        widget = list_item.get_child()
-        assert isinstance(widget, ContextMenuListItem)
-        widget.label.set_text(item.label)
+    def get_list_item_template_xml(self):
+        return LIST_ITEM_TEMPLATE
 
     def _load_actions_immediately(self):
-        for action in self._actions:
-            if action.label.strip():
-                self._item_store.append(action)
+        self.add_items([action for action in self._actions if action.label.strip()])
         if self._item_store.get_n_items() > 0:
             self._selection_model.set_selected(0)
         self._content_stack.set_visible_child_name("results")
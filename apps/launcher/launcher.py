@@ -10,6 +10,11 @@ gi.require_version("Adw", "1")
 
 from gi.repository import Gtk, Adw, Gio, Gdk, GLib
 
+_KEY_RETURN = Gdk.KEY_Return
+_KEY_KP_ENTER = Gdk.KEY_KP_Enter
+_KEY_UP = Gdk.KEY_Up
+_KEY_DOWN = Gdk.KEY_Down
+_KEY_ESCAPE = Gdk.KEY_Escape
 
 class AppHistory:
     def __init__(self):
@@ -18,6 +23,7 @@ class AppHistory:
         )
         self.data_file = Path(data_home) / "net.knoopx.launcher" / "history.json"
         self.term_app_launches = self._load_data()
+        self._total_launch_counts = None
 
     def _load_data(self):
         try:
@@ -46,13 +52,17 @@ class AppHistory:
         self.term_app_launches[normalized_term][app_id] = (
             self.term_app_launches[normalized_term].get(app_id, 0) + 1
         )
+        self._total_launch_counts = None
         self._save_data()
 
     def get_total_launch_count(self, app_id):
-        total = 0
-        for search_term_data in self.term_app_launches.values():
-            total += search_term_data.get(app_id, 0)
-        return total
+        if self._total_launch_counts is None:
+            totals = {}
+            for search_term_data in self.term_app_launches.values():
+                for launched_app_id, count in search_term_data.items():
+                    totals[launched_app_id] = totals.get(launched_app_id, 0) + count
+            self._total_launch_counts = totals
+        return self._total_launch_counts.get(app_id, 0)
 
     def get_search_term_launch_count(self, app_id, search_term):
         if not search_term.strip():
@@ -83,6 +93,9 @@ class LauncherWindow(Adw.ApplicationWindow):
         self.launcher_app = launcher_app  # Reference to launcher app
         self.app_history = launcher_app.app_history if launcher_app else AppHistory()
         self.apps_loaded = False
+        self._pending_select_row = None
+        self._visible_count = 0
+        self._select_idle_id = 0
 
         self.set_default_size(500, 620)
         self.set_title("Applications")
@@ -171,6 +184,7 @@ class LauncherWindow(Adw.ApplicationWindow):
 
     def _clear_list_box(self):
         """Clear all rows from list box"""
+        self._visible_count = 0
         child = self.list_box.get_first_child()
         while child:
             next_child = child.get_next_sibling()
@@ -240,34 +254,38 @@ class LauncherWindow(Adw.ApplicationWindow):
         for i, (row, _) in enumerate(visible_rows):
             self.list_box.remove(row)
             self.list_box.insert(row, i)
+        self._visible_count = len(visible_rows)
 
         # Select first visible row
-        first_row_to_select = visible_rows[0][0] if visible_rows else None
-        if first_row_to_select:
-            GLib.idle_add(self._select_row_safe, first_row_to_select)
-        else:
-            GLib.idle_add(self.list_box.unselect_all)
+        self._schedule_select_row(visible_rows[0][0] if visible_rows else None)
         return False
 
-    def _select_row_safe(self, row):
-        try:
-            if row.get_parent() == self.list_box:
-                self.list_box.select_row(row)
-                self.scroll_to_row(row)
-        except Exception:
-            pass
-        return False
+    def _schedule_select_row(self, row):
+        self._pending_select_row = row
+        if self._select_idle_id == 0:
+            self._select_idle_id = GLib.idle_add(self._select_pending_row)
+
+    def _select_pending_row(self):
+        row = self._pending_select_row
+        self._pending_select_row = None
+        self._select_idle_id = 0
+        if row is None:
+            self.list_box.unselect_all()
+        elif row.get_parent() == self.list_box:
+            self.list_box.select_row(row)
+            self.scroll_to_row(row)
+        return GLib.SOURCE_REMOVE
 
     def on_key_press(self, controller, keyval, keycode, state):
-        if keyval == Gdk.KEY_Return or keyval == Gdk.KEY_KP_Enter:
+        if keyval == _KEY_RETURN or keyval == _KEY_KP_ENTER:
             return False
-        elif keyval == Gdk.KEY_Up:
+        elif keyval == _KEY_UP:
             self.move_selection(-1)
             return True
-        elif keyval == Gdk.KEY_Down:
+        elif keyval == _KEY_DOWN:
             self.move_selection(1)
             return True
-        elif keyval == Gdk.KEY_Escape:
+        elif keyval == _KEY_ESCAPE:
             self.close()
             return True
         return False
@@ -288,17 +306,11 @@ class LauncherWindow(Adw.ApplicationWindow):
 
     def scroll_to_row(self, row):
         adj = self.scrolled.get_vadjustment()
-        if not adj:
+        coords = row.translate_coordinates(self.list_box, 0, 0)
+        if not adj or coords is None:
             return
-        row_height = row.get_allocated_height()
-        row_y = row.get_allocation().y
-        visible_height = self.scrolled.get_allocated_height()
-        visible_top = adj.get_value()
-        visible_bottom = visible_top + visible_height
-        if row_y < visible_top or row_y + row_height > visible_bottom:
-            target = row_y - (visible_height - row_height) / 2
-            target = max(0, min(target, adj.get_upper() - visible_height))
-            adj.set_value(target)
+        row_y = coords[1]
+        adj.clamp_page(row_y, row_y + row.get_height())
 
     def move_selection(self, direction):
         selected = self.list_box.get_selected_row()
@@ -313,13 +325,10 @@ class LauncherWindow(Adw.ApplicationWindow):
             self.scroll_to_row(next_row)
 
     def find_next_visible_row(self, start_index, direction):
-        index = start_index + direction
-        n_items = self.list_box.observe_children().get_n_items()
-        while 0 <= index < n_items:
-            row = self.list_box.get_row_at_index(index)
-            if row and row.get_visible():
-                return row
-            index += direction
+        # Visible rows are always moved to the top of the list box.
+        index = min(start_index, self._visible_count) + direction
+        if 0 <= index < self._visible_count:
+            return self.list_box.get_row_at_index(index)
         return None
 
     def launch_app(self, app_info, search_term):
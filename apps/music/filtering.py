@@ -196,8 +196,7 @@ class MusicFilter:
         end_index = min(
             state.current_index + state.batch_size, len(state.filtered_releases)
         )
-        for i in range(state.current_index, end_index):
-            self.window.add_item(state.filtered_releases[i])
+        self.window.add_items(state.filtered_releases[state.current_index : end_index])
         if state.current_index == 0:
             self.window._show_results()
         state.current_index = end_index
@@ -210,7 +209,7 @@ class MusicFilter:
 
     def refresh_ui_with_sorted_releases(self) -> None:
         self.window.remove_all_items()
-        current_query = self.window.get_search_text().strip()
+        current_query = self.window.get_search_text()
         star_filter_active = self._get_star_filter_state()
         collection_filter = self._get_collection_filter_state()
         if not current_query:
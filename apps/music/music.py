@@ -77,7 +77,7 @@ class MusicWindow(PickerWindow):
     def _on_refresh_filter_shortcut(
         self, action: Gio.SimpleAction, param: Optional[GLib.Variant]
     ) -> None:
-        current_query = self.get_search_text().strip()
+        current_query = self.get_search_text()
         self.on_search_changed(current_query)
 
     def _setup_css(self) -> None:
@@ -261,7 +261,7 @@ class MusicWindow(PickerWindow):
                     self._refresh_collection_dropdown()
 
                     # Refresh the view if we're currently filtering by this collection
-                    current_query = self.get_search_text().strip()
+                    current_query = self.get_search_text()
                     self.on_search_changed(current_query)
 
             return remove_from_collection_action
@@ -73,7 +73,7 @@ class ScanningCoordinator:
         if release.path in existing_paths:
             return
         self.window._all_releases.append(release)
-        current_query = self.window.get_search_text().strip()
+        current_query = self.window.get_search_text()
         star_filter_active = (
             hasattr(self.window, "_star_filter_button")
             and self.window._star_filter_button.get_starred()
@@ -106,7 +106,7 @@ class ScanningCoordinator:
         self.window.set_loading(False)
         self.window._update_progress(0.0)
         self.window.remove_all_items()
-        current_query = self.window.get_search_text().strip()
+        current_query = self.window.get_search_text()
         if current_query:
             self.window.on_search_changed(current_query)
         else:
@@ -239,6 +239,7 @@ class NixPackagesWindow(PickerWindow):
                     description="Try a different search term or check for typos.",
                 )
                 return GLib.SOURCE_REMOVE
+            packages = []
             for hit_element in packages_array:
                 source_obj = hit_element["_source"]
                 name = source_obj["package_attr_name"]
@@ -253,10 +254,17 @@ class NixPackagesWindow(PickerWindow):
                 source_url = (
                     f"https://github.com/NixOS/nixpkgs/blob/master/{file_path}#L{line}"
                 )
-                package = PackageItem(
-                    name, version, description, homepage_url, licenses_str, source_url
+                packages.append(
+                    PackageItem(
+                        name,
+                        version,
+                        description,
+                        homepage_url,
+                        licenses_str,
+                        source_url,
+                    )
                 )
-                self.add_item(package)
+            self.add_items(packages)
             if self._item_store.get_n_items() > 0:
                 self._show_results()
             else:
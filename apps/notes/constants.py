@@ -1,3 +1,4 @@
 import os
 NOTES_DIR = os.path.expanduser('~/Documents/Notes')
-EXT = '.md'
\ No newline at end of file
+EXT = '.md'
+CACHE_DIR = os.path.expanduser('~/.cache/net.knoopx.notes')
\ No newline at end of file
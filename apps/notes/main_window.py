@@ -80,7 +80,7 @@ class MainWindow(Adw.ApplicationWindow):
         self.note_content_view.set_parent_window(self)
         self.note_content_view.set_hexpand(True)
         self.note_content_view.set_vexpand(True)
-        self.note_content_view.connect('content-saved', self.on_content_view_saved)
+        self.note_content_view.set_save_handler(self.on_content_view_saved)
         self.note_content_view.connect('edit-mode-exited', self.on_content_view_edit_exited)
         self.split_view.set_content(self.note_content_view)
         self.sidebar_button = Gtk.Button()
@@ -109,38 +109,31 @@ class MainWindow(Adw.ApplicationWindow):
         selected_note_relative_path = None
         if self.current_note:
             selected_note_relative_path = self.current_note.relative_path
-        while True:
-            row = self.note_list.get_first_child()
-            if row is None:
-                break
-            self.note_list.remove(row)
         search_text = self.entry.get_text().lower()
         all_notes = self.repository.get_all_notes()
         self.filtered_notes = [note for note in all_notes if search_text in note.relative_path.lower()]
         self.filtered_notes.sort(key=lambda note: note.display_name.split(os.sep))
+        self.note_list.handler_block_by_func(self.on_note_selected)
+        self.note_list.unselect_all()
         select_row_after_refresh = None
-        for note_obj in self.filtered_notes:
-            row = Gtk.ListBoxRow()
-            label = Gtk.Label(label=note_obj.display_name)
-            label.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
-            label.set_max_width_chars(80)
-            label.set_xalign(0)
-            label.set_margin_start(5)
-            label.set_margin_end(5)
-            label.set_margin_top(5)
-            label.set_margin_bottom(5)
+        for index, note_obj in enumerate(self.filtered_notes):
+            row = self._acquire_row(index)
             row.note_object = note_obj
-            row.set_child(label)
-            self.note_list.append(row)
-            context_menu_gesture = Gtk.GestureClick.new()
-            context_menu_gesture.set_button(Gdk.BUTTON_SECONDARY)
-            context_menu_gesture.connect('pressed', self.on_row_right_click)
-            row.add_controller(context_menu_gesture)
+            row.get_child().set_label(note_obj.display_name)
+            row.set_visible(True)
             if note_obj.relative_path == selected_note_relative_path:
                 select_row_after_refresh = row
+        index = len(self.filtered_notes)
+        while True:
+            row = self.note_list.get_row_at_index(index)
+            if row is None:
+                break
+            self._release_row(row)
+            index += 1
+        self.note_list.handler_unblock_by_func(self.on_note_selected)
         if select_row_after_refresh:
             self.note_list.select_row(select_row_after_refresh)
-        elif self.note_list.get_row_at_index(0):
+        elif self.filtered_notes:
             first_row = self.note_list.get_row_at_index(0)
             self.note_list.select_row(first_row)
             if first_row:
@@ -154,6 +147,31 @@ class MainWindow(Adw.ApplicationWindow):
             self.note_content_view.set_content('')
         self.entry.grab_focus()
 
+    def _acquire_row(self, index):
+        row = self.note_list.get_row_at_index(index)
+        if row is not None:
+            return row
+        row = Gtk.ListBoxRow()
+        label = Gtk.Label()
+        label.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
+        label.set_max_width_chars(80)
+        label.set_xalign(0)
+        label.set_margin_start(5)
+        label.set_margin_end(5)
+        label.set_margin_top(5)
+        label.set_margin_bottom(5)
+        row.set_child(label)
+        context_menu_gesture = Gtk.GestureClick.new()
+        context_menu_gesture.set_button(Gdk.BUTTON_SECONDARY)
+        context_menu_gesture.connect('pressed', self.on_row_right_click)
+        row.add_controller(context_menu_gesture)
+        self.note_list.append(row)
+        return row
+
+    def _release_row(self, row):
+        row.note_object = None
+        row.set_visible(False)
+
     def on_search_entry_key_press(self, controller, keyval, keycode, state):
         if keyval == Gdk.KEY_Escape:
             self.entry.set_text('')
@@ -386,7 +404,7 @@ class MainWindow(Adw.ApplicationWindow):
             content = self.repository.load_note_content(self.current_note)
         self.note_content_view.set_content(content, is_editing=False)
 
-    def on_content_view_saved(self, note_content_view, content):
+    def on_content_view_saved(self, content):
         if self.current_note:
             if not self.repository.save_note_content(self.current_note, content):
                 print(f'Failed to save content for {self.current_note.relative_path} via repository.')
@@ -1,7 +1,51 @@
+import itertools
+import json
+import os
+import shutil
 import subprocess
-from gi.repository import GLib, GObject, Gdk, Gtk, GtkSource, WebKit
-from constants import NOTES_DIR
+import tempfile
 import threading
+from functools import cache
+import xxhash
+from gi.repository import GLib, GObject, Gdk, Gtk, GtkSource, WebKit
+from constants import CACHE_DIR, NOTES_DIR
+
+MARKDOWN_CACHE_DIR = os.path.join(CACHE_DIR, "md_cache")
+MARKDOWN_CACHE_MAX_ENTRIES = 500
+MARKDOWN_CACHE_PRUNE_INTERVAL = 50
+PREVIEW_BASE_URI = f"file://{NOTES_DIR}/"
+PREVIEW_CHUNK_SIZE = 50
+PREVIEW_UPDATE_SCRIPT = """
+(function (html, chunkSize) {
+  const generation = (window.previewGeneration || 0) + 1;
+  window.previewGeneration = generation;
+  const template = document.createElement("template");
+  template.innerHTML = html;
+  const nodes = Array.from(template.content.childNodes);
+  const appendChunk = () => {
+    if (nodes.length && window.previewGeneration === generation) {
+      document.body.append(...nodes.splice(0, chunkSize));
+      requestAnimationFrame(appendChunk);
+    }
+  };
+  requestAnimationFrame(() => {
+    if (window.previewGeneration !== generation) {
+      return;
+    }
+    document.body.replaceChildren(...nodes.splice(0, chunkSize));
+    window.scrollTo(0, 0);
+    requestAnimationFrame(appendChunk);
+  });
+})(%s, %d);
+"""
+
+
+def extract_body(html_content):
+    start = html_content.find("<body>")
+    end = html_content.rfind("</body>")
+    if start == -1 or end == -1:
+        return None
+    return html_content[start + len("<body>") : end]
 
 
 def markdown(markdown_content):
@@ -18,6 +62,73 @@ def markdown(markdown_content):
     return stdout.strip()
 
 
+@cache
+def renderer_identity():
+    path = shutil.which("md2html")
+    if path is None:
+        return ""
+    path = os.path.realpath(path)
+    try:
+        return f"{path}:{os.stat(path).st_mtime_ns}"
+    except OSError:
+        return path
+
+
+def content_hash(markdown_content):
+    hasher = xxhash.xxh3_64()
+    hasher.update(renderer_identity().encode("utf-8", "replace"))
+    hasher.update(b"\0")
+    hasher.update(markdown_content.encode("utf-8", "replace"))
+    return hasher.hexdigest()
+
+
+def prune_markdown_cache():
+    try:
+        entries = list(os.scandir(MARKDOWN_CACHE_DIR))
+        excess = len(entries) - MARKDOWN_CACHE_MAX_ENTRIES
+        if excess <= 0:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+    except OSError:
+        return
+    for entry in entries[:excess]:
+        try:
+            os.remove(entry.path)
+        except OSError as e:
+            print(f"Error pruning markdown cache {entry.path}: {e}")
+
+
+_markdown_cache_writes = itertools.count()
+
+
+def cached_markdown(markdown_content, key):
+    cache_path = os.path.join(MARKDOWN_CACHE_DIR, f"{key}.html")
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            html_content = f.read()
+        os.utime(cache_path)
+        return html_content
+    except OSError:
+        pass
+    html_content = markdown(markdown_content)
+    try:
+        os.makedirs(MARKDOWN_CACHE_DIR, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=MARKDOWN_CACHE_DIR)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(html_content)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            os.unlink(temp_path)
+            raise
+    except OSError as e:
+        print(f"Error writing markdown cache {cache_path}: {e}")
+        return html_content
+    if next(_markdown_cache_writes) % MARKDOWN_CACHE_PRUNE_INTERVAL == 0:
+        prune_markdown_cache()
+    return html_content
+
+
 class NoteContentView(Gtk.Box):
     __gsignals__ = {
         "content-saved": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
@@ -26,9 +137,15 @@ class NoteContentView(Gtk.Box):
 
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
+        self._content_saved_signal_id = GObject.signal_lookup(
+            "content-saved", NoteContentView
+        )
         self.parent_window = None
         self.is_editing = False
         self._current_content = ""
+        self._save_handler = None
+        self._preview_loaded = False
+        self._last_rendered_hash = None
         self.content_stack = Gtk.Stack()
         self.content_stack.set_hexpand(True)
         self.content_stack.set_vexpand(True)
@@ -62,7 +179,15 @@ class NoteContentView(Gtk.Box):
         content_key_controller.connect("key-pressed", self.on_content_key_press)
         self.source_view.add_controller(content_key_controller)
         preview_scroll = Gtk.ScrolledWindow()
-        self.webview = WebKit.WebView()
+        web_context = WebKit.WebContext.get_default()
+        web_context.set_cache_model(WebKit.CacheModel.WEB_BROWSER)
+        network_session = WebKit.NetworkSession.new(
+            os.path.join(CACHE_DIR, "webkit-data"),
+            os.path.join(CACHE_DIR, "webkit"),
+        )
+        self.webview = WebKit.WebView(
+            web_context=web_context, network_session=network_session
+        )
         self.webview.set_vexpand(True)
         self.webview.set_hexpand(True)
         rgba = Gdk.RGBA()
@@ -75,6 +200,7 @@ class NoteContentView(Gtk.Box):
         settings.set_property("allow-universal-access-from-file-urls", True)
         settings.set_property("allow-file-access-from-file-urls", True)
         self.webview.connect("decide-policy", self.on_webview_decide_policy)
+        self.webview.connect("load-changed", self.on_webview_load_changed)
         click_gesture = Gtk.GestureClick()
         click_gesture.set_button(1)
         click_gesture.connect("pressed", self.on_webview_double_click)
@@ -88,6 +214,9 @@ class NoteContentView(Gtk.Box):
     def set_parent_window(self, parent):
         self.parent_window = parent
 
+    def set_save_handler(self, handler):
+        self._save_handler = handler
+
     def set_content(self, content, is_editing=False):
         self._current_content = content
         self.is_editing = is_editing
@@ -98,24 +227,49 @@ class NoteContentView(Gtk.Box):
             self.content_stack.set_visible_child_name("edit")
             self.source_view.grab_focus()
         else:
+            self.content_stack.set_visible_child_name("preview")
+            key = content_hash(self._current_content)
+            if (
+                key == self._last_rendered_hash
+                and self.webview.get_uri() == PREVIEW_BASE_URI
+            ):
+                return
+            self._last_rendered_hash = key
+            markdown_content = self._current_content
 
             def convert_and_load():
                 try:
-                    html_content = markdown(self._current_content)
-                    GLib.idle_add(self._update_preview, html_content)
+                    html_content = cached_markdown(markdown_content, key)
+                    GLib.idle_add(self._update_preview, html_content, key)
                 except Exception as e:
                     print(f"Error converting markdown: {e}")
-                    GLib.idle_add(self._update_preview, f"<p>Error: {e}</p>")
+                    GLib.idle_add(self._update_preview, f"<p>Error: {e}</p>", None)
 
             thread = threading.Thread(target=convert_and_load)
             thread.daemon = True
             thread.start()
-            self.content_stack.set_visible_child_name("preview")
 
-    def _update_preview(self, html_content):
-        self.webview.load_html(html_content, f"file://{NOTES_DIR}/")
+    def _update_preview(self, html_content, key):
+        if key is None:
+            self._last_rendered_hash = None
+        elif key != self._last_rendered_hash:
+            return False
+        body = extract_body(html_content) if self._preview_loaded else None
+        if body is None:
+            self._preview_loaded = False
+            self.webview.load_html(html_content, PREVIEW_BASE_URI)
+        else:
+            script = PREVIEW_UPDATE_SCRIPT % (json.dumps(body), PREVIEW_CHUNK_SIZE)
+            self.webview.evaluate_javascript(script, -1, None, None, None, None, None)
         return False
 
+    def on_webview_load_changed(self, webview, load_event):
+        if webview.get_uri() != PREVIEW_BASE_URI:
+            self._preview_loaded = False
+            self._last_rendered_hash = None
+        elif load_event == WebKit.LoadEvent.FINISHED:
+            self._preview_loaded = True
+
     def get_content(self):
         start_iter = self.content_buffer.get_start_iter()
         end_iter = self.content_buffer.get_end_iter()
@@ -124,8 +278,13 @@ class NoteContentView(Gtk.Box):
     def save_content(self):
         if self.is_editing:
             content = self.get_content()
-            self.emit("content-saved", content)
             self._current_content = content
+            if self._save_handler:
+                self._save_handler(content)
+            if GObject.signal_has_handler_pending(
+                self, self._content_saved_signal_id, 0, False
+            ):
+                self.emit("content-saved", content)
 
     def enter_edit_mode(self, cursor_at_end=False):
         if not self.is_editing:
@@ -52,6 +52,7 @@ in
     preFixup = ''
       gappsWrapperArgs+=(--prefix PATH : "${md2html}/bin" --prefix PYTHONPATH : "${pkgs.python313.withPackages (p: [
         p.pygobject3
+        p.xxhash
       ])}/${pkgs.python313.sitePackages}")
     '';
 
@@ -1,21 +1,38 @@
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Gtk, Adw, Gio, GLib, GObject, Gdk
-from abc import ABC, abstractmethod
-from typing import Optional, Any, List, Callable
 
+QUERY_CACHE_SIZE = 32
+SEARCH_MAX_LATENCY_MS = 1000
+VECTORIZED_FILTER_MIN_ITEMS = 2000
+
+
+_optional_modules = {}
 
-class PickerItem(GObject.Object):
-    __gtype_name__ = "PickerItem"
 
+def _optional_import(name: str) -> Any | None:
+    """Import `name` on first use, returning None if it is unavailable."""
+    if name not in _optional_modules:
+        try:
+            _optional_modules[name] = import_module(name)
+        except ImportError:
+            _optional_modules[name] = None
+    return _optional_modules[name]
 
-class GObjectABCMeta(type(GObject.Object), type(ABC)):
-    pass
+
+class PickerItem(GObject.Object):
+    __gtype_name__ = "PickerItem"
 
 
-class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
+class PickerWindow(Adw.ApplicationWindow):
     # ============================================================================
     # INITIALIZATION & SETUP
     # ============================================================================
@@ -26,8 +43,8 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
         search_placeholder: str = "Search...",
         window_size: tuple = (500, 620),
         search_delay_ms: int = 300,
-        context_menu_shortcut: Optional[str] = "<Control>j",
-        global_context_menu_shortcut: Optional[str] = "<Control><Shift>j",
+        context_menu_shortcut: str | None = "<Control>j",
+        global_context_menu_shortcut: str | None = "<Control><Shift>j",
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -37,9 +54,29 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
         self._context_menu_shortcut = context_menu_shortcut
         self._global_context_menu_shortcut = global_context_menu_shortcut
         self._item_store = Gio.ListStore.new(self.get_item_type())
-        self._selection_model = Gtk.SingleSelection(model=self._item_store)
+        self._store_items: list[Any] = []
+        self._search_keys: list[str] = []
+        self._search_keys_array = None
+        self._search_keys_blob: tuple[str, list[int]] | None = None
+        self._use_search_keys = (
+            type(self).get_search_key is not PickerWindow.get_search_key
+        )
+        if self._use_search_keys:
+            self._item_store.connect("items-changed", self._on_item_store_changed)
+        self._filter_query = ""
+        self._filter_matches: set = set()
+        self._custom_filter = Gtk.CustomFilter.new(self._match_filter_func)
+        self._filter_model = Gtk.FilterListModel(model=self._item_store)
+        self._selection_model = Gtk.SingleSelection(model=self._filter_model)
         self._search_delay_id = 0
+        self._current_query = ""
+        self._pending_query = ""
+        self._first_change_time = 0
+        self._last_change_time = 0
+        self._index_cache: OrderedDict[str, list[int]] = OrderedDict()
         self._is_loading = False
+        self._data_loaded = False
+        self._rebinding_items = False
         self.set_default_size(*window_size)
         self.set_title(title)
         self._setup_ui()
@@ -48,7 +85,6 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
             self._setup_context_menu_actions()
         if self._global_context_menu_shortcut is not None:
             self._setup_global_context_menu_actions()
-        self.load_initial_data()
 
     # ============================================================================
     # UI SETUP METHODS
@@ -85,9 +121,15 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
 
     def _setup_results_view(self) -> None:
         scrolled_window = Gtk.ScrolledWindow(vexpand=True)
-        factory = Gtk.SignalListItemFactory()
-        factory.connect("setup", self._on_list_item_setup)
-        factory.connect("bind", self._on_list_item_bind)
+        template_xml = self.get_list_item_template_xml()
+        if template_xml is not None:
+            factory = Gtk.BuilderListItemFactory.new_from_bytes(
+                None, GLib.Bytes.new(template_xml.encode())
+            )
+        else:
+            factory = Gtk.SignalListItemFactory()
+            factory.connect("setup", self._on_list_item_setup)
+            factory.connect("bind", self._on_list_item_bind)
         self._list_view = Gtk.ListView(model=self._selection_model, factory=factory)
         self._list_view.set_vexpand(True)
         self._list_view.set_can_focus(True)
@@ -105,6 +147,17 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
         self._list_view.add_controller(controller)
 
     def _setup_status_pages(self) -> None:
+        self._empty_page = Adw.StatusPage(
+            title=self.get_empty_title(),
+            description=self.get_empty_description(),
+            icon_name=self.get_empty_icon(),
+        )
+        self._content_stack.add_named(self._empty_page, "empty")
+        self._error_page: Adw.StatusPage | None = None
+
+    def _ensure_loading_page(self) -> None:
+        if self._content_stack.get_child_by_name("loading") is not None:
+            return
         loading_page = Adw.StatusPage(
             title="Loading...", icon_name=self.get_loading_icon()
         )
@@ -113,22 +166,22 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
         )
         loading_page.set_child(spinner)
         self._content_stack.add_named(loading_page, "loading")
-        self._empty_page = Adw.StatusPage(
-            title=self.get_empty_title(),
-            description=self.get_empty_description(),
-            icon_name=self.get_empty_icon(),
-        )
-        self._content_stack.add_named(self._empty_page, "empty")
-        self._error_page = Adw.StatusPage(
-            title="An Error Occurred",
-            description="Could not load data.",
-            icon_name="dialog-error-symbolic",
-        )
-        self._content_stack.add_named(self._error_page, "error")
+
+    def _ensure_error_page(self) -> Adw.StatusPage:
+        if self._error_page is None:
+            self._error_page = Adw.StatusPage(
+                title="An Error Occurred",
+                description="Could not load data.",
+                icon_name="dialog-error-symbolic",
+            )
+            self._content_stack.add_named(self._error_page, "error")
+        return self._error_page
 
     def _setup_signals(self) -> None:
         self._search_entry.connect("search-changed", self._on_search_changed)
         self._search_entry.connect("activate", self._on_search_activated)
+        self._search_entry.connect("stop-search", self._on_search_stopped)
+        self._search_entry.set_key_capture_widget(self)
         search_key_controller = Gtk.EventControllerKey()
         search_key_controller.connect("key-pressed", self._on_search_key_pressed)
         self._search_entry.add_controller(search_key_controller)
@@ -170,7 +223,7 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
         self.show_context_menu()
         return True
 
-    def show_context_menu(self, anchor_widget: Optional[Gtk.Widget] = None) -> None:
+    def show_context_menu(self, anchor_widget: Gtk.Widget | None = None) -> None:
         selected_item = self.get_selected_item()
 
         if not selected_item:
@@ -228,15 +281,13 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
         context_menu.present()
 
     def _setup_context_menu_gesture(
-        self, widget: Gtk.Widget, item: Any, list_item: Optional[Gtk.ListItem] = None
+        self, widget: Gtk.Widget, list_item: Gtk.ListItem
     ) -> None:
         if self._context_menu_shortcut is None:
             return
         context_menu_gesture = Gtk.GestureClick.new()
         context_menu_gesture.set_button(Gdk.BUTTON_SECONDARY)
-        context_menu_gesture.connect(
-            "pressed", self._on_item_right_click, item, list_item
-        )
+        context_menu_gesture.connect("pressed", self._on_item_right_click, list_item)
         widget.add_controller(context_menu_gesture)
 
     def _setup_global_context_menu_actions(self) -> None:
@@ -255,7 +306,7 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
         return True
 
     def show_global_context_menu(
-        self, anchor_widget: Optional[Gtk.Widget] = None
+        self, anchor_widget: Gtk.Widget | None = None
     ) -> None:
         menu_model = self.get_global_context_menu_model()
         if not menu_model:
@@ -301,27 +352,37 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
     # ============================================================================
 
     def _on_window_map(self, window: Gtk.Window) -> None:
+        if not self._data_loaded:
+            self._data_loaded = True
+            self.load_initial_data()
         self._search_entry.grab_focus()
         self.on_window_shown()
 
     def _on_search_changed(self, entry: Gtk.SearchEntry) -> None:
-        if self._search_delay_id > 0:
-            GLib.source_remove(self._search_delay_id)
         query = entry.get_text().strip()
+        if query == self._current_query:
+            return
+        self._current_query = query
+        self._prune_search_cache(query)
         if not query:
-            self._search_delay_id = 0
+            if self._search_delay_id > 0:
+                GLib.source_remove(self._search_delay_id)
+                self._search_delay_id = 0
             self._apply_empty_search()
             return
-        self._search_delay_id = GLib.timeout_add(
-            self._search_delay_ms, self._apply_search, query
-        )
+        now = GLib.get_monotonic_time()
+        self._pending_query = query
+        self._last_change_time = now
+        if self._search_delay_id == 0:
+            self._first_change_time = now
+            self._search_delay_id = GLib.timeout_add(
+                self._search_delay_ms, self._on_search_delay_elapsed
+            )
 
     def _on_search_activated(self, entry: Gtk.SearchEntry) -> None:
-        selected_pos = self._selection_model.get_selected()
-        if selected_pos != Gtk.INVALID_LIST_POSITION:
-            item = self._item_store.get_item(selected_pos)
-            if item:
-                self.on_item_activated(item)
+        item = self._selection_model.get_selected_item()
+        if item:
+            self.on_item_activated(item)
 
     def _on_search_key_pressed(
         self,
@@ -330,10 +391,7 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
         keycode: int,
         state: Gdk.ModifierType,
     ) -> bool:
-        if keyval == Gdk.KEY_Escape:
-            return self.on_escape_pressed()
-
-        elif keyval == Gdk.KEY_Up or keyval == Gdk.KEY_Down:
+        if keyval == Gdk.KEY_Up or keyval == Gdk.KEY_Down:
             self._forward_navigation_to_list(keyval, keycode, state)
             return True
         return False
@@ -345,20 +403,17 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
         keycode: int,
         state: Gdk.ModifierType,
     ) -> bool:
-        if keyval == Gdk.KEY_Return or keyval == Gdk.KEY_KP_Enter:
-            selected_item = self.get_selected_item()
-            if selected_item:
-                self.on_item_activated(selected_item)
-                return True
-        elif keyval == Gdk.KEY_Escape:
+        if keyval == Gdk.KEY_Escape:
             self._search_entry.grab_focus()
             self._search_entry.select_region(0, -1)
             text_length = len(self._search_entry.get_text())
             self._search_entry.set_position(text_length)
             return True
-
         return False
 
+    def _on_search_stopped(self, entry: Gtk.SearchEntry) -> None:
+        self.on_escape_pressed()
+
     def on_listview_key_pressed(
         self,
         controller: Gtk.EventControllerKey,
@@ -374,7 +429,7 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
         self._list_view.grab_focus()
 
     def _on_list_view_activate(self, list_view: Gtk.ListView, position: int) -> None:
-        item = self._item_store.get_item(position)
+        item = self._filter_model.get_item(position)
         if item:
             self.on_item_activated(item)
 
@@ -387,15 +442,14 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
         self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem
     ) -> None:
         self.setup_list_item(list_item)
+        child_widget = list_item.get_child()
+        if child_widget:
+            self._setup_context_menu_gesture(child_widget, list_item)
 
     def _on_list_item_bind(
         self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem
     ) -> None:
-        item = list_item.get_item()
-        self.bind_list_item(list_item, item)
-        child_widget = list_item.get_child()
-        if child_widget and item:
-            self._setup_context_menu_gesture(child_widget, item, list_item)
+        self.bind_list_item(list_item, list_item.get_item())
 
     def _on_item_right_click(
         self,
@@ -403,14 +457,12 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
         n_press: int,
         x: float,
         y: float,
-        item: Any,
-        list_item: Optional[Gtk.ListItem] = None,
+        list_item: Gtk.ListItem,
     ) -> None:
         if n_press == 1:
-            if list_item:
-                position = list_item.get_position()
-                if self._selection_model.get_selected() != position:
-                    self._selection_model.set_selected(position)
+            position = list_item.get_position()
+            if self._selection_model.get_selected() != position:
+                self._selection_model.set_selected(position)
             anchor_for_menu = gesture.get_widget()
             self.show_context_menu(anchor_widget=anchor_for_menu)
 
@@ -422,24 +474,46 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
     # ============================================================================
 
     def _apply_empty_search(self) -> None:
+        if self._filter_query:
+            self.set_item_filter("")
         self.on_search_cleared()
-        if self._item_store.get_n_items() > 0:
+        if self._filter_model.get_n_items() > 0:
             self._show_results()
         else:
             self._show_empty()
 
+    def _on_search_delay_elapsed(self) -> bool:
+        now = GLib.get_monotonic_time()
+        idle_ms = (now - self._last_change_time) // 1000
+        waited_ms = (now - self._first_change_time) // 1000
+        if idle_ms < self._search_delay_ms and waited_ms < SEARCH_MAX_LATENCY_MS:
+            remaining_ms = min(
+                self._search_delay_ms - idle_ms, SEARCH_MAX_LATENCY_MS - waited_ms
+            )
+            self._search_delay_id = GLib.timeout_add(
+                max(1, remaining_ms), self._on_search_delay_elapsed
+            )
+            return GLib.SOURCE_REMOVE
+        return self._apply_search(self._pending_query)
+
     def _apply_search(self, query: str) -> bool:
         self._search_delay_id = 0
         self.on_search_changed(query)
         return GLib.SOURCE_REMOVE
 
+    def _prune_search_cache(self, query: str) -> None:
+        query = query.casefold()
+        for cached_query in list(self._index_cache):
+            if not query.startswith(cached_query):
+                del self._index_cache[cached_query]
+
     def _forward_navigation_to_list(
         self, keyval: int, keycode: int, state: Gdk.ModifierType
     ) -> None:
         self._list_view.grab_focus()
         if (
             self._selection_model.get_selected() == Gtk.INVALID_LIST_POSITION
-            and self._item_store.get_n_items() > 0
+            and self._filter_model.get_n_items() > 0
         ):
             self._selection_model.set_selected(0)
 
@@ -449,16 +523,17 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
 
     def _show_loading(self) -> None:
         self._is_loading = True
+        self._ensure_loading_page()
         self._content_stack.set_visible_child_name("loading")
 
     def _show_results(self) -> None:
         self._is_loading = False
         self._content_stack.set_visible_child_name("results")
-        if self._item_store.get_n_items() > 0:
+        if self._filter_model.get_n_items() > 0:
             self._selection_model.set_selected(0)
 
     def _show_empty(
-        self, title: Optional[str] = None, description: Optional[str] = None
+        self, title: str | None = None, description: str | None = None
     ) -> None:
         self._is_loading = False
         if title:
@@ -469,25 +544,152 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
 
     def _show_error(self, message: str) -> None:
         self._is_loading = False
-        self._error_page.set_description(message)
+        self._ensure_error_page().set_description(message)
         self._content_stack.set_visible_child_name("error")
 
     # ============================================================================
     # ITEM MANAGEMENT METHODS
     # ============================================================================
 
+    def _on_item_store_changed(
+        self, store: Gio.ListStore, position: int, removed: int, added: int
+    ) -> None:
+        if self._rebinding_items:
+            return
+        for item in self._store_items[position : position + removed]:
+            self._filter_matches.discard(id(item))
+        new_items = [store.get_item(i) for i in range(position, position + added)]
+        new_keys = [self.get_search_key(item).casefold() for item in new_items]
+        self._store_items[position : position + removed] = new_items
+        self._search_keys[position : position + removed] = new_keys
+        self._search_keys_array = None
+        self._search_keys_blob = None
+        self._index_cache.clear()
+        if self._filter_query:
+            new_indices = list(range(position, position + added))
+            query = self._filter_query.casefold()
+            for i in self.incremental_filter(new_indices, query):
+                self._filter_matches.add(id(self._store_items[i]))
+
     def add_item(self, item: Any) -> None:
+        """Append a single item; prefer `add_items` for bulk loads."""
         self._item_store.append(item)
 
+    def add_items(self, items: list[Any]) -> None:
+        self._item_store.splice(self._item_store.get_n_items(), 0, items)
+
+    def rebind_items(self) -> None:
+        """Re-run row binding for every item after their fields changed in
+        place, without treating the store contents as changed."""
+        n_items = self._item_store.get_n_items()
+        if not n_items:
+            return
+        self._rebinding_items = True
+        try:
+            self._item_store.items_changed(0, n_items, n_items)
+        finally:
+            self._rebinding_items = False
+
     def remove_all_items(self) -> None:
         self._item_store.remove_all()
 
-    def get_selected_item(self) -> Optional[Any]:
-        selected_pos = self._selection_model.get_selected()
-        if selected_pos != Gtk.INVALID_LIST_POSITION:
-            return self._item_store.get_item(selected_pos)
+    def invalidate_search_cache(self) -> None:
+        self._index_cache.clear()
+
+    def _lookup_prefix(self, cache: OrderedDict, query: str) -> list[int] | None:
+        for length in range(len(query), 0, -1):
+            prefix = query[:length]
+            cached = cache.get(prefix)
+            if cached is not None:
+                cache.move_to_end(prefix)
+                return cached
         return None
 
+    def _store_prefix(self, cache: OrderedDict, query: str, results: list[int]) -> None:
+        cache[query] = results
+        cache.move_to_end(query)
+        while len(cache) > QUERY_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def get_selected_item(self) -> Any | None:
+        return self._selection_model.get_selected_item()
+
+    def set_item_filter(self, query: str) -> None:
+        """Filter the item store in place by the keys from `get_search_key`.
+
+        Narrowing a query to one that extends the previous one only
+        re-checks the items that are still visible.
+        """
+        previous_query = self._filter_query
+        self._filter_query = query
+        if query:
+            indices = self.search_indices(query)
+            self._filter_matches = {id(self._store_items[i]) for i in indices}
+        if not query:
+            self._filter_model.set_filter(None)
+        elif not previous_query:
+            self._filter_model.set_filter(self._custom_filter)
+        elif query.startswith(previous_query):
+            self._custom_filter.changed(Gtk.FilterChange.MORE_STRICT)
+        elif previous_query.startswith(query):
+            self._custom_filter.changed(Gtk.FilterChange.LESS_STRICT)
+        else:
+            self._custom_filter.changed(Gtk.FilterChange.DIFFERENT)
+
+    def search_indices(self, query: str) -> list[int]:
+        """Return the store positions whose search key contains `query`."""
+        query = query.casefold()
+        prev_indices = self._lookup_prefix(self._index_cache, query)
+        indices = self.incremental_filter(prev_indices, query)
+        self._store_prefix(self._index_cache, query, indices)
+        return indices
+
+    def incremental_filter(
+        self, prev_indices: list[int] | None, query: str
+    ) -> list[int]:
+        """Narrow `prev_indices`, the matches of a prefix of `query`, or
+        scan every search key when there is no such prefix."""
+        keys = self._search_keys
+        if prev_indices is not None:
+            return [i for i in prev_indices if query in keys[i]]
+        if len(keys) >= VECTORIZED_FILTER_MIN_ITEMS:
+            np = _optional_import("numpy")
+            if np is not None:
+                return np.flatnonzero(self.filter_contains(query)).tolist()
+        return self.filter_blob(query)
+
+    def filter_contains(self, query: str):
+        """Return a boolean mask of search keys containing `query`."""
+        np = _optional_import("numpy")
+        if self._search_keys_array is None:
+            self._search_keys_array = np.array(self._search_keys, dtype=np.str_)
+        return np.char.find(self._search_keys_array, query) >= 0
+
+    def filter_blob(self, query: str) -> list[int]:
+        """Return the positions of search keys containing `query` by
+        scanning all keys joined into one string."""
+        if self._search_keys_blob is None:
+            offsets = []
+            position = 0
+            for key in self._search_keys:
+                offsets.append(position)
+                position += len(key) + 1
+            self._search_keys_blob = ("\0".join(self._search_keys), offsets)
+        blob, offsets = self._search_keys_blob
+        n_keys = len(offsets)
+        indices = []
+        position = blob.find(query)
+        while position != -1:
+            index = bisect_right(offsets, position) - 1
+            indices.append(index)
+            if index + 1 >= n_keys:
+                break
+            position = blob.find(query, offsets[index + 1])
+        return indices
+
+    def _match_filter_func(self, item: Any) -> bool:
+        return id(item) in self._filter_matches
+
     # ============================================================================
     # PUBLIC API METHODS
     # ============================================================================
@@ -495,13 +697,24 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
     def set_loading(self, loading: bool) -> None:
         if loading:
             self._show_loading()
-        elif self._item_store.get_n_items() > 0:
+        elif self._filter_model.get_n_items() > 0:
             self._show_results()
         else:
             self._show_empty()
 
     def set_search_text(self, text: str) -> None:
+        """Set the search text and filter once, bypassing the debounce."""
+        if self._search_delay_id > 0:
+            GLib.source_remove(self._search_delay_id)
+            self._search_delay_id = 0
+        query = text.strip()
+        self._current_query = query
         self._search_entry.set_text(text)
+        self._prune_search_cache(query)
+        if query:
+            self._apply_search(query)
+        else:
+            self._apply_empty_search()
 
     def get_search_text(self) -> str:
         return self._search_entry.get_text().strip()
@@ -510,39 +723,32 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
     # ABSTRACT METHODS (MUST BE IMPLEMENTED BY SUBCLASSES)
     # ============================================================================
 
-    @abstractmethod
     def get_item_type(self) -> type:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def setup_list_item(self, list_item: Gtk.ListItem) -> None:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def bind_list_item(self, list_item: Gtk.ListItem, item: Any) -> None:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def on_item_activated(self, item: Any) -> None:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def load_initial_data(self) -> None:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def on_search_changed(self, query: str) -> None:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    def get_context_menu_model(self, item: Any) -> Optional[Gio.Menu]:
-        pass
+    def get_context_menu_model(self, item: Any) -> Gio.Menu | None:
+        raise NotImplementedError
 
     def get_global_context_menu_actions(self) -> dict:
         """Return global context menu actions. Override to provide global actions."""
         return {}
 
-    def get_global_context_menu_model(self) -> Optional[Gio.Menu]:
+    def get_global_context_menu_model(self) -> Gio.Menu | None:
         """Return global context menu model. Override to provide global menu."""
         return None
 
@@ -553,6 +759,14 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
     def on_search_cleared(self) -> None:
         pass
 
+    def get_search_key(self, item: Any) -> str:
+        """Return the text `set_item_filter` matches against for `item`.
+
+        Pickers that call `set_item_filter` must override this; a
+        casefolded key is kept per store position and matched by substring.
+        """
+        return ""
+
     def on_escape_pressed(self) -> bool:
         self.close()
         return True
@@ -579,11 +793,16 @@ class PickerWindow(Adw.ApplicationWindow, ABC, metaclass=GObjectABCMeta):
     def get_empty_description(self) -> str:
         return "Type your query in the search bar above."
 
-    def get_header_bar_left_widgets(self) -> List[Gtk.Widget]:
+    def get_list_item_template_xml(self) -> str | None:
+        """Return a GtkListItem builder template to bind rows without Python
+        callbacks; `setup_list_item`/`bind_list_item` are used otherwise."""
+        return None
+
+    def get_header_bar_left_widgets(self) -> list[Gtk.Widget]:
         return []
 
-    def get_header_bar_title_widget(self) -> Optional[Gtk.Widget]:
+    def get_header_bar_title_widget(self) -> Gtk.Widget | None:
         return self._search_entry
 
-    def get_header_bar_right_widgets(self) -> List[Gtk.Widget]:
+    def get_header_bar_right_widgets(self) -> list[Gtk.Widget]:
         return []
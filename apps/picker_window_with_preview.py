@@ -1,14 +1,13 @@
 import gi
-from abc import ABC, abstractmethod
 from typing import Optional, Any
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Gtk, Adw, GLib
-from picker_window import PickerWindow, GObjectABCMeta
+from picker_window import PickerWindow
 
 
-class PickerWindowWithPreview(PickerWindow, ABC, metaclass=GObjectABCMeta):
+class PickerWindowWithPreview(PickerWindow):
     def __init__(
         self,
         title: str = "Picker",
@@ -154,9 +153,8 @@ class PickerWindowWithPreview(PickerWindow, ABC, metaclass=GObjectABCMeta):
         else:
             self._clear_preview()
 
-    @abstractmethod
     def create_preview_widget(self, item: Any) -> Optional[Gtk.Widget]:
-        pass
+        raise NotImplementedError
 
     def on_preview_item_changed(self, item: Optional[Any]) -> None:
         pass
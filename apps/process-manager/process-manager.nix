@@ -37,6 +37,7 @@ pkgs.python313Packages.buildPythonApplication {
       --prefix PYTHONPATH : "$out/lib/python:${pkgs.python313.withPackages (p: [
       p.pygobject3
       p.psutil
+      p.numpy
     ])}/${pkgs.python313.sitePackages}"
     )
   '';
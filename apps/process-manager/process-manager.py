@@ -1,23 +1,99 @@
 #!/usr/bin/env python3
+import bisect
 import gi
+import operator
 import os
 import signal
 import psutil
+import pwd
+import resource
 import threading
 import sys
+import time
+from functools import cache
 from typing import Optional
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw, GLib, GObject, Gio
+from gi.repository import Gtk, Adw, GLib, Gio, Pango
 from picker_window import PickerWindow, PickerItem
 
 APP_ID = "net.knoopx.process-manager"
+PROCESS_ATTRS = [
+    "pid",
+    "name",
+    "cmdline",
+    "uids",
+    "cpu_percent",
+    "memory_info",
+    "memory_percent",
+    "status",
+    "create_time",
+]
+STATIC_ATTRS = ["pid", "name", "cmdline", "uids", "create_time"]
+POLLED_ATTRS = ["cpu_percent", "memory_info", "memory_percent", "status"]
+KILL_REFRESH_DELAY_MS = 100
+CPU_WARMUP_MS = 500
+REFRESH_BATCH_SIZE = 50
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = resource.getpagesize()
+TOTAL_MEMORY = psutil.virtual_memory().total
+PROC_STATUSES = {
+    "R": psutil.STATUS_RUNNING,
+    "S": psutil.STATUS_SLEEPING,
+    "D": psutil.STATUS_DISK_SLEEP,
+    "T": psutil.STATUS_STOPPED,
+    "t": psutil.STATUS_TRACING_STOP,
+    "Z": psutil.STATUS_ZOMBIE,
+    "X": psutil.STATUS_DEAD,
+    "x": psutil.STATUS_DEAD,
+    "K": psutil.STATUS_WAKE_KILL,
+    "W": psutil.STATUS_WAKING,
+    "I": psutil.STATUS_IDLE,
+    "P": psutil.STATUS_PARKED,
+}
+
+
+@cache
+def _username(uid):
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+def _read_proc_stat(pid):
+    try:
+        with open(f"/proc/{pid}/stat", "rb", buffering=0) as f:
+            data = f.read()
+    except OSError:
+        return None
+    fields = data[data.rfind(b")") + 2 :].split()
+    return (
+        fields[0].decode(),
+        int(fields[11]) + int(fields[12]),
+        int(fields[19]),
+        int(fields[21]) * PAGE_SIZE,
+    )
+
+
+def _fast_process_snapshot():
+    try:
+        entries = os.scandir("/proc")
+    except OSError:
+        return None
+    snapshot = {}
+    with entries:
+        for entry in entries:
+            if entry.name.isdigit():
+                stat = _read_proc_stat(entry.name)
+                if stat is not None:
+                    snapshot[int(entry.name)] = stat
+    return snapshot
 
 
 class ProcessListItem(Gtk.Box):
     def __init__(self):
-        import gi.repository.Pango as Pango
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0, margin_top=0, margin_bottom=0, margin_start=0, margin_end=0)
 
         self.main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12, margin_top=8, margin_bottom=8, margin_start=12, margin_end=12)
@@ -61,78 +137,72 @@ class ProcessListItem(Gtk.Box):
         self.main_box.append(self.info_box)
         self.main_box.append(self.resource_box)
         self.append(self.main_box)
+        self._texts = {}
+
+    def set_label_text(self, label, text):
+        if self._texts.get(label) == text:
+            return False
+        self._texts[label] = text
+        label.set_text(text)
+        return True
 
 
 class ProcessItem(PickerItem):
     __gtype_name__ = "ProcessItem"
-    pid = GObject.Property(type=int, default=0)
-    name = GObject.Property(type=str, default="")
-    cmdline = GObject.Property(type=str, default="")
-    username = GObject.Property(type=str, default="")
-    cpu_percent = GObject.Property(type=float, default=0.0)
-    memory_percent = GObject.Property(type=float, default=0.0)
-    memory_rss = GObject.Property(type=GObject.TYPE_INT64, default=0)
-    status = GObject.Property(type=str, default="")
-    create_time = GObject.Property(type=float, default=0.0)
-
-    def __init__(self, process):
+    cpu_ticks = 0
+    start_ticks = 0
+
+    def __init__(self, info):
         super().__init__()
-        try:
-            self.pid = process.pid
-            self.name = process.name()
-            try:
-                cmdline = process.cmdline()
-                self.cmdline = " ".join(cmdline) if cmdline else self.name
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                self.cmdline = self.name
-            try:
-                self.username = process.username()
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                self.username = "unknown"
-            try:
-                self.cpu_percent = process.cpu_percent()
-                memory_info = process.memory_info()
-                self.memory_rss = memory_info.rss
-                self.memory_percent = process.memory_percent()
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                self.cpu_percent = 0.0
-                self.memory_rss = 0
-                self.memory_percent = 0.0
-            try:
-                self.status = process.status()
-                self.create_time = process.create_time()
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                self.status = "unknown"
-                self.create_time = 0.0
-        except psutil.NoSuchProcess:
-            self.pid = 0
-            self.name = "Process not found"
-            self.cmdline = ""
-            self.username = ""
-            self.cpu_percent = 0.0
-            self.memory_percent = 0.0
-            self.memory_rss = 0
-            self.status = "gone"
-            self.create_time = 0.0
+        self.pid = info["pid"] or 0
+        self.name = info["name"] or ""
+        cmdline = info["cmdline"]
+        self.cmdline = " ".join(cmdline) if cmdline else self.name
+        uids = info["uids"]
+        self.username = _username(uids.real) if uids else "unknown"
+        self.cpu_percent = info.get("cpu_percent") or 0.0
+        memory_info = info.get("memory_info")
+        self.memory_rss = memory_info.rss if memory_info else 0
+        self.memory_percent = info.get("memory_percent") or 0.0
+        self.status = info.get("status") or "unknown"
+        self.create_time = info["create_time"] or 0.0
+        self._name_lc = self.name.lower()
+        self._pid_label = str(self.pid)
+        self._cmd_label = self.cmdline if self.cmdline != self.name else ""
+        self._search_key = (
+            f"{self.name}\0{self.pid}\0{self.cmdline}\0{self.username}".lower()
+        )
+
+    def update(self, info):
+        self.cpu_percent = info["cpu_percent"] or 0.0
+        memory_info = info["memory_info"]
+        self.memory_rss = memory_info.rss if memory_info else 0
+        self.memory_percent = info["memory_percent"] or 0.0
+        self.status = info["status"] or "unknown"
+
+    def update_from_stat(self, stat, elapsed):
+        state, cpu_ticks, start_ticks, rss = stat
+        if elapsed > 0 and start_ticks == self.start_ticks:
+            self.cpu_percent = (cpu_ticks - self.cpu_ticks) / CLK_TCK / elapsed * 100
+        self.cpu_ticks = cpu_ticks
+        self.start_ticks = start_ticks
+        self.memory_rss = rss
+        self.memory_percent = rss / TOTAL_MEMORY * 100
+        self.status = PROC_STATUSES.get(state, "unknown")
 
     def get_memory_mb(self):
         return self.memory_rss / (1024 * 1024)
 
-    def __eq__(self, other):
-        if not isinstance(other, ProcessItem):
-            return False
-        return self.pid == other.pid
-
-    def __hash__(self):
-        return hash(self.pid)
-
 
 class ProcessManagerWindow(PickerWindow):
 
     def __init__(self, **kwargs):
         self._current_processes = []
-        self._filtered_processes = []
         self._refresh_thread = None
+        self._proc_cache = {}
+        self._items_by_pid = {}
+        self._pid_to_pos = {}
+        self._last_snapshot_time = 0.0
         self._should_refresh = True
         super().__init__(
             title="Process Manager",
@@ -147,26 +217,37 @@ class ProcessManagerWindow(PickerWindow):
     def load_initial_data(self):
         self._refresh_processes()
 
+    def get_search_key(self, item):
+        return item._search_key
+
+    def incremental_filter(self, prev_indices, query):
+        tokens = query.split()
+        if len(tokens) < 2:
+            return super().incremental_filter(prev_indices, query.strip())
+        indices = super().incremental_filter(prev_indices, tokens[0])
+        keys = self._search_keys
+        for token in tokens[1:]:
+            indices = [i for i in indices if token in keys[i]]
+        return indices
+
     def on_search_changed(self, query):
         if not query.strip():
             self.on_search_cleared()
             return
-        query_lower = query.lower()
-        filtered = []
-        for process in self._current_processes:
-            if (
-                query_lower in process.name.lower()
-                or query_lower in str(process.pid)
-                or query_lower in process.cmdline.lower()
-                or (query_lower in process.username.lower())
-            ):
-                filtered.append(process)
-        self._filtered_processes = filtered
-        self._update_ui()
+        self.set_item_filter(query.lower())
+        self._update_visibility()
 
     def on_search_cleared(self):
-        self._filtered_processes = self._current_processes[:]
-        self._update_ui()
+        self.set_item_filter("")
+        self._update_visibility()
+
+    def _update_visibility(self):
+        if self._filter_model.get_n_items():
+            self._show_results()
+        else:
+            self._show_empty(
+                "No Processes Found", "No processes match your search criteria."
+            )
 
     def on_item_activated(self, item):
         if not item or item.pid == 0:
@@ -187,16 +268,14 @@ class ProcessManagerWindow(PickerWindow):
 
     def bind_list_item(self, list_item, item):
         widget = list_item.get_child()
-        if isinstance(widget, ProcessListItem):
-            widget.name_label.set_text(item.name)
-            widget.pid_label.set_text(str(item.pid))
-            cmd_text = (
-                item.cmdline if item.cmdline and item.cmdline != item.name else ""
-            )
-            widget.cmd_label.set_text(cmd_text)
-            widget.cmd_label.set_visible(bool(cmd_text))
-            widget.user_label.set_text(item.username)
-            widget.status_label.set_text(item.status)
+        if widget is not None:
+            widget.set_label_text(widget.name_label, item.name)
+            widget.set_label_text(widget.pid_label, item._pid_label)
+            cmd_text = item._cmd_label
+            if widget.set_label_text(widget.cmd_label, cmd_text):
+                widget.cmd_label.set_visible(bool(cmd_text))
+            widget.set_label_text(widget.user_label, item.username)
+            widget.set_label_text(widget.status_label, item.status)
             widget.cpu_label.set_text(f"{item.cpu_percent:.1f}%")
             widget.mem_label.set_text(f"{item.get_memory_mb():.0f}MB")
 
@@ -254,7 +333,19 @@ class ProcessManagerWindow(PickerWindow):
             )
 
     def _kill_process(self, process_item, sig):
-        os.kill(process_item.pid, sig)
+        self._kill_many([process_item.pid], sig)
+
+    def _kill_many(self, pids, sig):
+        for pid in pids:
+            try:
+                os.kill(pid, sig)
+            except OSError as e:
+                print(f"Error sending signal to process {pid}: {e}")
+        GLib.timeout_add(KILL_REFRESH_DELAY_MS, self._refresh_once)
+
+    def _refresh_once(self):
+        self._refresh_processes()
+        return GLib.SOURCE_REMOVE
 
     def _refresh_processes(self):
         if not self._should_refresh:
@@ -262,22 +353,63 @@ class ProcessManagerWindow(PickerWindow):
 
         def get_processes():
             try:
+                snapshot_time = time.monotonic()
+                snapshot = _fast_process_snapshot()
+                current = set(snapshot) if snapshot else set(psutil.pids())
+                for pid in self._proc_cache.keys() - current:
+                    del self._proc_cache[pid]
+                initial_scan = not self._proc_cache
                 processes = []
-                for proc in psutil.process_iter(
-                    ["pid", "name", "username", "status", "create_time"]
-                ):
-                    try:
-                        process_item = ProcessItem(proc)
-                        if process_item.pid > 0:
-                            processes.append(process_item)
-                    except (
-                        psutil.NoSuchProcess,
-                        psutil.AccessDenied,
-                        psutil.ZombieProcess,
+                stat_updates = []
+                info_updates = []
+                for pid in current:
+                    cached = self._proc_cache.get(pid)
+                    stat = snapshot.get(pid) if snapshot else None
+                    if (
+                        cached is not None
+                        and stat is not None
+                        and stat[2] != cached[1].start_ticks
                     ):
+                        cached = None
+                    try:
+                        if cached is None:
+                            proc = psutil.Process(pid)
+                            attrs = PROCESS_ATTRS if stat is None else STATIC_ATTRS
+                            process_item = ProcessItem(
+                                proc.as_dict(attrs=attrs, ad_value=None)
+                            )
+                            if stat is not None:
+                                process_item.update_from_stat(stat, 0.0)
+                            self._proc_cache[pid] = (proc, process_item)
+                        elif stat is not None:
+                            process_item = cached[1]
+                            stat_updates.append((process_item, stat))
+                        else:
+                            proc, process_item = cached
+                            info_updates.append(
+                                (
+                                    process_item,
+                                    proc.as_dict(attrs=POLLED_ATTRS, ad_value=None),
+                                )
+                            )
+                    except psutil.NoSuchProcess:
+                        self._proc_cache.pop(pid, None)
                         continue
-                processes.sort(key=lambda p: p.name.lower())
-                GLib.idle_add(self._update_process_list, processes)
+                    if process_item.pid > 0:
+                        processes.append(process_item)
+                        if initial_scan and len(processes) % REFRESH_BATCH_SIZE == 0:
+                            GLib.idle_add(
+                                self._update_process_list,
+                                sorted(processes, key=operator.attrgetter("_name_lc")),
+                            )
+                processes.sort(key=operator.attrgetter("_name_lc"))
+                GLib.idle_add(
+                    self._update_process_list,
+                    processes,
+                    stat_updates,
+                    info_updates,
+                    snapshot_time,
+                )
             except Exception as e:
                 print(f"Error refreshing processes: {e}")
 
@@ -287,70 +419,93 @@ class ProcessManagerWindow(PickerWindow):
         self._refresh_thread.start()
         return GLib.SOURCE_CONTINUE
 
-    def _update_process_list(self, processes):
+    def _update_process_list(
+        self, processes, stat_updates=(), info_updates=(), snapshot_time=None
+    ):
+        if snapshot_time is not None:
+            if not self._last_snapshot_time:
+                GLib.timeout_add(CPU_WARMUP_MS, self._refresh_once)
+            elapsed = snapshot_time - self._last_snapshot_time
+            self._last_snapshot_time = snapshot_time
+            for process_item, stat in stat_updates:
+                process_item.update_from_stat(stat, elapsed)
+            for process_item, info in info_updates:
+                process_item.update(info)
         self._current_processes = processes
-        current_query = self.get_search_text()
-        if current_query.strip():
-            self.on_search_changed(current_query)
-        else:
-            self.on_search_cleared()
+        self._update_ui()
         return GLib.SOURCE_REMOVE
 
     def _update_ui(self):
-        if not self._filtered_processes:
+        if not self._current_processes:
             self.remove_all_items()
+            self._items_by_pid = {}
+            self._pid_to_pos = {}
             self._show_empty(
                 "No Processes Found", "No processes match your search criteria."
             )
             return
-        selected_pid = None
-        selected_position = None
-        selected_position = self._selection_model.get_selected()
-        if selected_position != Gtk.INVALID_LIST_POSITION:
-            selected_item = self._item_store.get_item(selected_position)
-            if selected_item:
-                selected_pid = selected_item.pid
-        current_items = []
-        for i in range(self._item_store.get_n_items()):
-            current_items.append(self._item_store.get_item(i))
-        current_pids = {item.pid for item in current_items}
-        new_pids = {process.pid for process in self._filtered_processes}
-        pids_to_add = new_pids - current_pids
-        pids_to_remove = current_pids - new_pids
-        if len(pids_to_add) > 10 or len(pids_to_remove) > 10:
-            self.remove_all_items()
-            for process in self._filtered_processes:
-                self.add_item(process)
-        else:
-            for i in reversed(range(len(current_items))):
-                item = current_items[i]
-                if item.pid in pids_to_remove:
-                    self._item_store.remove(i)
-            processes_to_add = []
-            for process in self._filtered_processes:
-                if process.pid in pids_to_add:
-                    processes_to_add.append(process)
-            processes_to_add.sort(key=lambda p: p.name.lower())
-            for process in processes_to_add:
-                self.add_item(process)
-            for i in range(self._item_store.get_n_items()):
-                current_item = self._item_store.get_item(i)
-                if current_item is not None:
-                    for new_process in self._filtered_processes:
-                        if new_process.pid == current_item.pid:
-                            current_item.cpu_percent = new_process.cpu_percent
-                            current_item.memory_rss = new_process.memory_rss
-                            current_item.memory_percent = new_process.memory_percent
-                            current_item.status = new_process.status
-                            self._item_store.items_changed(i, 1, 1)
-                            break
-        self._show_results()
+        selected_item = self._selection_model.get_selected_item()
+        selected_pid = selected_item.pid if selected_item else None
+        items_by_pid = self._items_by_pid
+        new_by_pid = {p.pid: p for p in self._current_processes}
+        pids_to_remove = {
+            pid
+            for pid, item in items_by_pid.items()
+            if new_by_pid.get(pid) is not item
+        }
+        pids_to_add = {
+            pid
+            for pid, process in new_by_pid.items()
+            if items_by_pid.get(pid) is not process
+        }
+        store_items = self._store_items
+        if pids_to_remove:
+            i = len(store_items)
+            while i > 0:
+                i -= 1
+                if store_items[i].pid not in pids_to_remove:
+                    continue
+                end = i + 1
+                while i > 0 and store_items[i - 1].pid in pids_to_remove:
+                    i -= 1
+                self._item_store.splice(i, end - i, [])
+            for pid in pids_to_remove:
+                del items_by_pid[pid]
+        self.rebind_items()
+        if pids_to_add:
+            names = [item._name_lc for item in store_items]
+            insertions = {}
+            for process in sorted(
+                (new_by_pid[pid] for pid in pids_to_add),
+                key=operator.attrgetter("_name_lc"),
+            ):
+                items_by_pid[process.pid] = process
+                position = bisect.bisect_right(names, process._name_lc)
+                insertions.setdefault(position, []).append(process)
+            for position in sorted(insertions, reverse=True):
+                self._item_store.splice(position, 0, insertions[position])
+        if pids_to_remove or pids_to_add:
+            self._pid_to_pos = None
+        self._update_visibility()
         if selected_pid is not None:
             self._restore_selection(selected_pid)
 
     def _restore_selection(self, selected_pid):
-        for i in range(self._item_store.get_n_items()):
-            item = self._item_store.get_item(i)
+        selected_item = self._selection_model.get_selected_item()
+        if selected_item is not None and selected_item.pid == selected_pid:
+            return True
+        if self._filter_model.get_filter() is None:
+            if self._pid_to_pos is None:
+                self._pid_to_pos = {
+                    item.pid: i for i, item in enumerate(self._store_items)
+                }
+            pos = self._pid_to_pos.get(selected_pid)
+            if pos is not None:
+                self._selection_model.set_selected(pos)
+                return True
+            return False
+        for i in range(self._filter_model.get_n_items()):
+            item = self._filter_model.get_item(i)
             if item is not None and item.pid == selected_pid:
                 self._selection_model.set_selected(i)
                 return True
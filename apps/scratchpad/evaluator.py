@@ -0,0 +1,186 @@
+import math
+import re
+from functools import lru_cache
+
+EVAL_CACHE_SIZE = 10000
+ASSIGNMENT_RE = re.compile(r"([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*(.+)")
+NUMERIC_ONLY_RE = re.compile(r"[\d\s+\-*/().%]+")
+ERROR_MESSAGES = {
+    ZeroDivisionError: "Division by zero",
+    SyntaxError: "Invalid syntax",
+}
+SAFE_NAMESPACE = {
+    "__builtins__": {},
+    # Basic math
+    "abs": abs,
+    "round": round,
+    "min": min,
+    "max": max,
+    "sum": sum,
+    "len": len,
+    "pow": pow,
+    "sqrt": math.sqrt,
+    "floor": math.floor,
+    "ceil": math.ceil,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "log": math.log10,
+    "ln": math.log,
+    "pi": math.pi,
+    "e": math.e,
+    "bin": lambda x: bin(int(x))[2:],  # Binary representation (without 0b prefix)
+    "hex": lambda x: hex(int(x))[2:],  # Hexadecimal representation (without 0x prefix)
+    "oct": lambda x: oct(int(x))[2:],  # Octal representation (without 0o prefix)
+    "log2": math.log2,  # Logarithm base 2
+    "gcd": math.gcd,  # Greatest common divisor
+    "lcm": lambda x, y: (
+        abs(int(x) * int(y)) // math.gcd(int(x), int(y)) if x != 0 and y != 0 else 0
+    ),  # Least common multiple
+    "factorial": math.factorial,
+    "avg": lambda *args: sum(args) / len(args) if args else 0,
+    "median": lambda *args: sorted(args)[len(args) // 2] if args else 0,
+    # Programming constants
+    "kb": 1024,  # Kilobyte
+    "mb": 1024**2,  # Megabyte
+    "gb": 1024**3,  # Gigabyte
+    "tb": 1024**4,  # Terabyte
+    # Time & date calculations (in seconds/minutes/hours/days)
+    "seconds": 1,
+    "minutes": 60,
+    "hours": 3600,
+    "days": 86400,
+    "weeks": 604800,
+    "years": 31536000,
+}
+
+
+@lru_cache(maxsize=4096)
+def _compile_expression(expression):
+    return compile(expression, "<string>", "eval")
+
+
+@lru_cache(maxsize=4096)
+def _eval_constant(expression):
+    return eval(_compile_expression(expression), {"__builtins__": {}})
+
+
+class Evaluator:
+    """Evaluates scratchpad text line by line, reusing the results of the
+    unchanged leading lines from the previous call."""
+
+    def __init__(self):
+        self.variables = {}
+        self._line_cache = []
+        self._line_results = []
+        self._eval_cache = {}
+        self._frozen_scope = (None, None)
+        self._eval_namespace = (None, None)
+
+    def evaluate(self, text):
+        """Return a `(text, is_error)` result for every line of `text`."""
+        lines = text.split("\n")
+        cache = self._line_cache
+        results = self._line_results
+        unchanged = 0
+        limit = min(len(cache), len(lines))
+        while unchanged < limit and cache[unchanged][0] == lines[unchanged]:
+            unchanged += 1
+        self.variables = cache[unchanged - 1][1] if unchanged else {}
+        if self._frozen_variables() is None:
+            # Later lines may have mutated values in the cached scope.
+            unchanged = 0
+            self.variables = {}
+        del cache[unchanged:]
+        del results[unchanged:]
+        for line in lines[unchanged:]:
+            results.append(self._evaluate_line(line))
+            cache.append((line, self.variables))
+        return results
+
+    def safe_eval(self, expression):
+        if "^" in expression:
+            expression = expression.replace("^", "**")
+        if NUMERIC_ONLY_RE.fullmatch(expression):
+            return _eval_constant(expression)
+        variables, namespace = self._eval_namespace
+        if variables is not self.variables:
+            namespace = {**SAFE_NAMESPACE, **self.variables}
+            self._eval_namespace = (self.variables, namespace)
+        if ":=" in expression:
+            namespace = namespace.copy()
+        return eval(_compile_expression(expression), namespace)
+
+    def parse_line(self, line):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            return (None, None, "")
+        assignment_match = ASSIGNMENT_RE.match(line)
+        if assignment_match:
+            var_name, expression = assignment_match.groups()
+            return ("assignment", var_name, expression)
+        return ("expression", None, line)
+
+    def _evaluate_line(self, line):
+        key = self._eval_cache_key(line)
+        if key is not None:
+            cached = self._eval_cache.get(key)
+            if cached is not None:
+                result, self.variables = cached
+                return result
+        result = self._evaluate_line_uncached(line)
+        if key is not None and self._frozen_variables() is not None:
+            if len(self._eval_cache) >= EVAL_CACHE_SIZE:
+                self._eval_cache.clear()
+            self._eval_cache[key] = (result, self.variables)
+        return result
+
+    def _eval_cache_key(self, line):
+        frozen = self._frozen_variables()
+        return None if frozen is None else (line, frozen)
+
+    def _frozen_variables(self):
+        variables, frozen = self._frozen_scope
+        if variables is not self.variables:
+            try:
+                frozen = frozenset(
+                    (name, type(value), value)
+                    for name, value in self.variables.items()
+                )
+            except TypeError:
+                frozen = None
+            self._frozen_scope = (self.variables, frozen)
+        return frozen
+
+    def _evaluate_line_uncached(self, line):
+        line_type, var_name, expression = self.parse_line(line)
+        if line_type is None:
+            return ("", False)
+        try:
+            result = self.safe_eval(expression)
+            if line_type == "assignment":
+                self.variables = {**self.variables, var_name: result}
+            text = self._fmt(result)
+        except Exception as e:
+            return (self._format_error(line_type, e), True)
+        if line_type == "assignment":
+            return (f"{var_name} = {text}", False)
+        return (text, False)
+
+    @staticmethod
+    def _fmt(value):
+        if type(value) is float and value.is_integer():
+            return str(int(value))
+        return str(value)
+
+    def _format_error(self, line_type, e):
+        if line_type == "assignment":
+            return str(e)
+        message = ERROR_MESSAGES.get(type(e))
+        if message is not None:
+            return message
+        if isinstance(e, NameError):
+            return f"Undefined variable - {e}"
+        if isinstance(e, ValueError):
+            return f"Invalid value - {e}"
+        return str(e)
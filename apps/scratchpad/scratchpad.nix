@@ -31,8 +31,10 @@ pkgs.python313Packages.buildPythonApplication {
   '';
 
   buildPhase = ''
-    mkdir -p $out/bin $out/share/pixmaps
-    install -m 755 -D scratchpad.py $out/bin/scratchpad
+    mkdir -p $out/{bin,share/scratchpad,share/pixmaps}
+    cp scratchpad.py evaluator.py $out/share/scratchpad/
+    chmod +x $out/share/scratchpad/scratchpad.py
+    ln -s $out/share/scratchpad/scratchpad.py $out/bin/scratchpad
     cp icon.png $out/share/pixmaps/net.knoopx.scratchpad.png
   '';
 
@@ -0,0 +1,29 @@
+from evaluator import Evaluator
+
+
+def evaluate(evaluator, text):
+    return [result_text for result_text, _ in evaluator.evaluate(text)]
+
+
+def test_edit_after_mutation_reevaluates_from_scratch():
+    evaluator = Evaluator()
+    assert evaluate(evaluator, "a = [1]\na.append(2)\nlen(a)")[-1] == "2"
+    assert evaluate(evaluator, "a = [1]\na.append(2) \nlen(a)")[-1] == "2"
+
+
+def test_generator_expression_sees_variables():
+    assert evaluate(Evaluator(), "r = 2\nsum(i*r for i in [1,2,3])")[-1] == "12"
+
+
+def test_walrus_does_not_leak_into_scope():
+    assert evaluate(Evaluator(), "a = 1\n(a := 7)\na")[-1] == "1"
+
+
+def test_unchanged_prefix_keeps_cached_results():
+    evaluator = Evaluator()
+    assert evaluate(evaluator, "x = 2\nx * 3") == ["x = 2", "6"]
+    assert evaluate(evaluator, "x = 2\nx * 4") == ["x = 2", "8"]
+
+
+def test_syntax_errors_are_flagged():
+    assert Evaluator().evaluate("1 +") == [("Invalid syntax", True)]
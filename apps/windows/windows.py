@@ -130,8 +130,6 @@ class WindowItem(PickerItem):
 class WindowsWindow(PickerWindow):
 
     def __init__(self, **kwargs):
-        self._current_windows = []
-        self._filtered_windows = []
         super().__init__(
             title="Windows",
             search_placeholder="Search windows by title, app, or workspace...",
@@ -145,27 +143,21 @@ class WindowsWindow(PickerWindow):
         self._refresh_windows()
 
     def on_search_changed(self, query):
-        if not query.strip():
-            self.on_search_cleared()
-            return
-
-        query_lower = query.lower()
-        filtered = []
-        for window in self._current_windows:
-            if (
-                query_lower in window.title.lower()
-                or query_lower in window.app_id.lower()
-                or query_lower in str(window.window_id)
-                or query_lower in str(window.workspace_id)
-                or query_lower in str(window.pid)
-            ):
-                filtered.append(window)
-
-        self._filtered_windows = filtered
+        self.set_item_filter(query)
         self._update_ui()
 
+    def get_search_key(self, item):
+        return "\0".join(
+            (
+                item.title,
+                item.app_id,
+                str(item.window_id),
+                str(item.workspace_id),
+                str(item.pid),
+            )
+        )
+
     def on_search_cleared(self):
-        self._filtered_windows = self._current_windows[:]
         self._update_ui()
 
     def on_item_activated(self, item):
@@ -334,46 +326,27 @@ class WindowsWindow(PickerWindow):
 
     def _update_windows_list(self, windows):
         """Update the windows list in the UI thread"""
-        self._current_windows = windows
-        current_query = self.get_search_text()
-        if current_query.strip():
-            self.on_search_changed(current_query)
-        else:
-            self.on_search_cleared()
+        selected_item = self.get_selected_item()
+        self.remove_all_items()
+        self.add_items(windows)
+        self._update_ui()
+        if selected_item is not None:
+            self._restore_selection(selected_item.window_id)
         return GLib.SOURCE_REMOVE
 
     def _update_ui(self):
-        """Update the UI with filtered windows"""
-        if not self._filtered_windows:
-            self.remove_all_items()
+        """Show the filtered windows, or the empty page if none match"""
+        if self._filter_model.get_n_items() == 0:
             self._show_empty(
                 "No Windows Found", "No windows match your search criteria."
             )
             return
-
-        # Get currently selected window ID to restore selection
-        selected_window_id = None
-        selected_position = self._selection_model.get_selected()
-        if selected_position != Gtk.INVALID_LIST_POSITION:
-            selected_item = self._item_store.get_item(selected_position)
-            if selected_item:
-                selected_window_id = selected_item.window_id
-
-        # Clear and repopulate for simplicity
-        self.remove_all_items()
-        for window in self._filtered_windows:
-            self.add_item(window)
-
         self._show_results()
 
-        # Restore selection
-        if selected_window_id is not None:
-            self._restore_selection(selected_window_id)
-
     def _restore_selection(self, selected_window_id):
         """Restore selection based on window ID"""
-        for i in range(self._item_store.get_n_items()):
-            item = self._item_store.get_item(i)
+        for i in range(self._filter_model.get_n_items()):
+            item = self._filter_model.get_item(i)
             if item is not None and getattr(item, 'window_id', None) == selected_window_id:
                 self._selection_model.set_selected(i)
                 return True
@@ -148,6 +148,11 @@ class WirelessNetworksWindow(PickerWindow):
         super().__init__(
             title="Wireless Networks", search_placeholder="Search by SSID...", **kwargs
         )
+        content = self.get_content()
+        self.set_content(None)
+        self._toast_overlay = Adw.ToastOverlay()
+        self._toast_overlay.set_child(content)
+        self.set_content(self._toast_overlay)
 
     def get_item_type(self):
         return WiFiNetwork
@@ -496,17 +501,6 @@ class WirelessNetworksWindow(PickerWindow):
         """Show a toast notification"""
         toast = Adw.Toast.new(message)
         toast.set_timeout(3)
-
-        # Find the toast overlay (create one if needed)
-        if not hasattr(self, "_toast_overlay"):
-            # Wrap existing content in toast overlay
-            content = self.get_content()
-            self.set_content(None)
-
-            self._toast_overlay = Adw.ToastOverlay()
-            self._toast_overlay.set_child(content)
-            self.set_content(self._toast_overlay)
-
         self._toast_overlay.add_toast(toast)
 
     def _run_nmcli_command(self, args):
@@ -648,8 +642,7 @@ class WirelessNetworksWindow(PickerWindow):
 
         # Update the list
         self.remove_all_items()
-        for network in self._filtered_networks:
-            self.add_item(network)
+        self.add_items(self._filtered_networks)
 
         self._show_results()
 